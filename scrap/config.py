@@ -13,11 +13,16 @@ PUBLIC_DIR = BASE_DIR / "public"
 OUTPUT_FILENAME = str(PUBLIC_DIR / "xbox_pc_games.json")
 LOG_FILENAME = str(BASE_DIR / "xbox_prices_scraper.log")
 HTML_DEBUG_DIR = BASE_DIR / "debug_html"
+CACHE_DIR = BASE_DIR / ".cache"
 
 # --- Parámetros generales ---
 MAX_JUEGOS = int(os.environ.get('MAX_JUEGOS', '4000'))
 MAX_RETRY_ATTEMPTS = 3
 REQUEST_TIMEOUT = 30  # segundos
+# Guarda el HTML completo de cada scraping en HTML_DEBUG_DIR (solo para depuración)
+DEBUG_SAVE_HTML = os.environ.get('DEBUG_SAVE_HTML', 'false').lower() in ('true', '1', 't', 'yes')
+# Dirección (host:puerto) de un Chrome ya iniciado con --remote-debugging-port al que conectarse
+CHROME_DEBUGGER_ADDRESS = os.environ.get('CHROME_DEBUGGER_ADDRESS')
 
 
 def ensure_dirs_exist() -> None:
@@ -2,9 +2,16 @@
 Módulo para gestionar datos de juegos (cargar, guardar, filtrar y generar mensajes).
 """
 import json
+import pickle
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any, TypedDict
-from scrap.config import logger
+from typing import Dict, Iterator, List, Optional, Any, TypedDict
+from scrap.config import logger, CACHE_DIR
+
+try:
+    import orjson  # Opcional: serialización/parseo JSON en C, bastante más rápido que json
+except ImportError:
+    orjson = None
 
 # --- Tipos ---
 class GameDict(TypedDict, total=False):
@@ -23,23 +30,68 @@ class GameDict(TypedDict, total=False):
 CANTIDAD_JUEGOS_MOSTRAR = 30
 
 # --- Carga y guardado de datos ---
+def _ruta_cache_datos_previos(path: Path) -> Path:
+    """
+    Devuelve la ruta del archivo de caché para un JSON de datos previos.
+    El nombre es datos_previos_<ruta>_<versión>: el primer hash identifica el JSON y
+    el segundo su fecha de modificación y tamaño.
+    """
+    stat = path.stat()
+    clave_ruta = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    clave_version = hashlib.blake2b(f"{stat.st_mtime_ns}|{stat.st_size}".encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / f"datos_previos_{clave_ruta}_{clave_version}.pkl"
+
+def _guardar_cache_datos_previos(cache_path: Path, juegos_previos: Dict[str, GameDict]) -> None:
+    """
+    Guarda los datos previos parseados en caché y elimina las entradas obsoletas
+    del mismo JSON (las cachés de otras rutas se conservan).
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        prefijo_ruta = cache_path.stem.rsplit("_", 1)[0]
+        for obsoleto in CACHE_DIR.glob(f"{prefijo_ruta}_*.pkl"):
+            if obsoleto != cache_path:
+                obsoleto.unlink(missing_ok=True)
+        cache_path.write_bytes(pickle.dumps(juegos_previos, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        logger.warning(f"No se pudo guardar la caché de datos previos: {e}")
+
 def cargar_datos_previos(json_file_path: str) -> Dict[str, GameDict]:
     """
     Carga los datos de juegos previos desde un archivo JSON si existe.
     Retorna un diccionario indexado por título.
+    Si el archivo no cambió desde la última carga, usa la caché en disco.
     """
     path = Path(json_file_path)
     if not path.exists():
         logger.info(f"No existe archivo previo {json_file_path}")
         return {}
     try:
-        with path.open('r', encoding='utf-8') as f:
-            datos = json.load(f)
+        cache_path: Optional[Path] = _ruta_cache_datos_previos(path)
+    except OSError as e:
+        # El archivo pudo desaparecer o quedar ilegible tras exists(): se intenta la lectura sin caché
+        logger.warning(f"No se pudo obtener el estado de {json_file_path}, se carga sin caché: {e}")
+        cache_path = None
+    if cache_path is not None and cache_path.exists():
+        try:
+            juegos_previos = pickle.loads(cache_path.read_bytes())
+            logger.info(f"Datos previos cargados desde caché: {len(juegos_previos)} juegos")
+            return juegos_previos
+        except Exception as e:
+            logger.warning(f"Caché de datos previos inválida, se vuelve a leer el JSON: {e}")
+    try:
+        if orjson is not None:
+            datos = orjson.loads(path.read_bytes())
+        else:
+            with path.open('r', encoding='utf-8') as f:
+                datos = json.load(f)
         if isinstance(datos, dict) and 'juegos' in datos and isinstance(datos['juegos'], list):
             juegos_previos = {j['titulo']: j for j in datos['juegos'] if 'titulo' in j}
         else:
             juegos_previos = {}
         logger.info(f"Datos previos cargados: {len(juegos_previos)} juegos")
+        if cache_path is not None:
+            _guardar_cache_datos_previos(cache_path, juegos_previos)
         return juegos_previos
     except json.JSONDecodeError as e:
         logger.error(f"Error al decodificar JSON de datos previos: {e}")
@@ -62,8 +114,12 @@ def guardar_datos(juegos: List[GameDict], output_filename: str) -> Optional[str]
     }
     try:
         Path(output_filename).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            json.dump(datos_completos, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # Mismo formato que json.dump(..., ensure_ascii=False, indent=2)
+            Path(output_filename).write_bytes(orjson.dumps(datos_completos, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_filename, 'w', encoding='utf-8') as f:
+                json.dump(datos_completos, f, ensure_ascii=False, indent=2)
         logger.info(f"Datos guardados en {output_filename} con fecha: {fecha_actual}")
         return fecha_actual
     except Exception as e:
@@ -71,14 +127,15 @@ def guardar_datos(juegos: List[GameDict], output_filename: str) -> Optional[str]
         return None
 
 # --- Filtrado de juegos ---
-def filtrar_juegos_por_precio(juegos: List[GameDict], tipo_filtro: str = "decreased") -> List[GameDict]:
+def filtrar_juegos_por_precio(juegos: List[GameDict], tipo_filtro: str = "decreased") -> Iterator[GameDict]:
     """
     Filtra la lista de juegos según el cambio de precio.
     tipo_filtro: "decreased", "increased" o "unchanged".
+    Devuelve un generador: el llamador decide si materializa el resultado.
     """
-    return [j for j in juegos if j.get('precio_cambio') == tipo_filtro 
+    return (j for j in juegos if j.get('precio_cambio') == tipo_filtro 
             and j.get('titulo') and j.get('titulo') != "Título no encontrado" 
-            and j.get('precio_num') is not None]
+            and j.get('precio_num') is not None)
 
 def filtrar_juegos_nuevos(juegos: List[GameDict]) -> List[GameDict]:
     """
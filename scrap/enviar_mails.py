@@ -87,10 +87,11 @@ async def enviar_notificaciones_desde_json(json_path: str, fecha_actual: Optiona
     if isinstance(juegos, dict) and 'juegos' in juegos:
         juegos = juegos['juegos']
 
-    # Filtrar juegos que bajaron de precio y calcular descuentos
-    juegos_bajaron_precio = filtrar_juegos_por_precio(juegos, "decreased")
-    for juego in juegos_bajaron_precio:
+    # Filtrar juegos que bajaron de precio y calcular descuentos en una sola pasada
+    juegos_bajaron_precio = []
+    for juego in filtrar_juegos_por_precio(juegos, "decreased"):
         calcular_descuento(juego)
+        juegos_bajaron_precio.append(juego)
     ordenar_por_descuento(juegos_bajaron_precio)
 
     # Filtrar juegos nuevos
@@ -5,60 +5,268 @@ Módulo de scraping para extraer los precios de juegos de Xbox.
 # =====================
 # Imports
 # =====================
-import os
+import io
 import re
 import time
+import atexit
+import shutil
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
 from functools import wraps, lru_cache
-from contextlib import contextmanager
-from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union, cast
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, TypeVar, cast
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    TimeoutException, NoSuchElementException, 
-    ElementClickInterceptedException, StaleElementReferenceException
+    TimeoutException, NoSuchElementException, WebDriverException,
+    ElementClickInterceptedException
 )
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from scrap.utils import clean_price_to_float, extract_discount_percentage, comparar_precio
-from scrap.config import logger, MAX_JUEGOS, MAX_RETRY_ATTEMPTS, REQUEST_TIMEOUT
+from scrap.config import (
+    logger, MAX_JUEGOS, MAX_RETRY_ATTEMPTS, REQUEST_TIMEOUT, DEBUG_SAVE_HTML, CHROME_DEBUGGER_ADDRESS, CACHE_DIR
+)
 
 # =====================
 # Constantes de Configuración
 # =====================
 URL_XBOX_TIENDA = "https://www.xbox.com/es-AR/games/all-games/pc?PlayWith=PC&xr=shellnav&orderby=Title+Asc"
-SELECTOR_CARD_WRAPPER = 'div[class*="ProductCard-module__cardWrapper"]'
-SELECTOR_TITULO = 'span[class*="ProductCard-module__title"]'
-SELECTOR_ENLACE = 'a[class*="commonStyles-module__basicButton"]'
-SELECTOR_IMAGEN = 'img[class*="ProductCard-module__boxArt"]'
-SELECTOR_PRECIO_CONTAINER = 'div[class*="ProductCard-module__priceGroup"]'
-SELECTOR_PRECIO_ORIGINAL = 'span[class*="Price-module__originalPrice"]'
-SELECTOR_PRECIO_ACTUAL = (
-    'span[class*="ProductCard-module__price"], '
-    'span[class*="Price-module__listedDiscountPrice"]'
-)
-SELECTOR_DESCUENTO_TAG = 'div[class*="ProductCard-module__discountTag"]'
+CLASE_CARD_WRAPPER = "ProductCard-module__cardWrapper"
+CLASE_TITULO = "ProductCard-module__title"
+CLASE_ENLACE = "commonStyles-module__basicButton"
+CLASE_IMAGEN = "ProductCard-module__boxArt"
+CLASE_PRECIO_CONTAINER = "ProductCard-module__priceGroup"
+CLASE_PRECIO_ORIGINAL = "Price-module__originalPrice"
+CLASES_PRECIO_ACTUAL = ("ProductCard-module__price", "Price-module__listedDiscountPrice")
+CLASE_DESCUENTO_TAG = "ProductCard-module__discountTag"
+SELECTOR_CARD_WRAPPER = f'div[class*="{CLASE_CARD_WRAPPER}"]'
+SELECTOR_TITULO = f'span[class*="{CLASE_TITULO}"]'
+SELECTOR_ENLACE = f'a[class*="{CLASE_ENLACE}"]'
+SELECTOR_IMAGEN = f'img[class*="{CLASE_IMAGEN}"]'
+SELECTOR_PRECIO_CONTAINER = f'div[class*="{CLASE_PRECIO_CONTAINER}"]'
+SELECTOR_PRECIO_ORIGINAL = f'span[class*="{CLASE_PRECIO_ORIGINAL}"]'
+SELECTOR_PRECIO_ACTUAL = ", ".join(f'span[class*="{clase}"]' for clase in CLASES_PRECIO_ACTUAL)
+SELECTOR_DESCUENTO_TAG = f'div[class*="{CLASE_DESCUENTO_TAG}"]'
 SELECTOR_GRID_CONTAINER = 'ol[class*="SearchProductGrid-module__container"]'
 XPATH_BOTON_CARGAR_MAS = "//button[.//div[contains(text(),'Cargar más')]]"
-XPATH_BOTON_COOKIES = "//button[@id='onetrust-accept-btn-handler']"
+ID_BOTON_COOKIES = "onetrust-accept-btn-handler"
 MAX_FALLOS_CONSECUTIVOS = 3
+# Intervalo de sondeo de las esperas del bucle de carga (WebDriverWait usa 0.5 s por defecto)
+POLL_FRECUENCIA = 0.1
+CHROME_DISK_CACHE_BYTES = 100 * 1024 * 1024
+TITULO_NO_ENCONTRADO = "Título no encontrado"
+# Recursos que no hacen falta para leer el DOM (las URLs de imagen siguen en el atributo src)
+URLS_BLOQUEADAS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.mp4", "*.webm",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*doubleclick*",
+]
+
+# Mantiene window.__cardCount actualizado con un MutationObserver, para que cada
+# consulta del conteo devuelva un entero en lugar de serializar todos los elementos.
+# window.__domChangeTs guarda el momento de la última mutación del DOM.
+JS_INSTALAR_CONTADOR_ITEMS = """
+const selector = arguments[0];
+window.__cardCount = document.querySelectorAll(selector).length;
+window.__domChangeTs = performance.now();
+if (!window.__cardObserver) {
+    window.__cardObserver = new MutationObserver(() => {
+        window.__cardCount = document.querySelectorAll(selector).length;
+        window.__domChangeTs = performance.now();
+    });
+    window.__cardObserver.observe(document.body, {childList: true, subtree: true});
+}
+"""
+# Espera compuesta de carga inicial: acepta el banner de cookies si está visible y
+# devuelve un objeto (truthy) solo cuando la grilla y la primera tarjeta visible existen.
+JS_PAGINA_LISTA = """
+const [selectorGrilla, selectorCard, idBotonCookies] = arguments;
+const botonCookies = document.getElementById(idBotonCookies);
+if (botonCookies && botonCookies.offsetParent !== null && !window.__cookiesAceptadas) {
+    botonCookies.click();
+    window.__cookiesAceptadas = true;
+}
+const card = document.querySelector(selectorCard);
+if (!document.querySelector(selectorGrilla) || !card || card.getClientRects().length === 0) {
+    return false;
+}
+return {cookiesAceptadas: !!window.__cookiesAceptadas};
+"""
+# Espera asíncrona (execute_async_script): resuelve con el nuevo conteo apenas el observer
+# detecta más tarjetas que `ultimo`, o con -1 si pasan timeoutMs sin cambios.
+JS_ESPERAR_NUEVOS_ITEMS = """
+const [ultimo, timeoutMs, selector] = arguments;
+const listo = arguments[arguments.length - 1];
+const contar = () => (typeof window.__cardCount === 'number')
+    ? window.__cardCount
+    : document.querySelectorAll(selector).length;
+if (contar() > ultimo) {
+    listo(contar());
+    return;
+}
+const observer = new MutationObserver(() => {
+    const conteo = contar();
+    if (conteo > ultimo) {
+        observer.disconnect();
+        clearTimeout(timer);
+        listo(conteo);
+    }
+});
+const timer = setTimeout(() => { observer.disconnect(); listo(-1); }, timeoutMs);
+observer.observe(document.body, {childList: true, subtree: true});
+"""
+# True cuando el DOM lleva al menos arguments[0] ms sin cambios (el lote terminó de renderizar)
+JS_DOM_ESTABLE = """
+return typeof window.__domChangeTs !== 'number'
+    || performance.now() - window.__domChangeTs >= arguments[0];
+"""
+JS_CONTAR_ITEMS = """
+return (typeof window.__cardCount === 'number')
+    ? window.__cardCount
+    : document.querySelectorAll(arguments[0]).length;
+"""
+# Extrae en el navegador los campos de todas las tarjetas en un solo viaje,
+# con la misma forma que _campos_desde_elemento (ver CamposCard).
+JS_EXTRAER_JUEGOS = """
+const s = arguments[0];
+const texto = (el) => el ? el.textContent : null;
+return Array.from(document.querySelectorAll(s.card), (card) => {
+    const enlace = card.querySelector(s.enlace);
+    const imagen = card.querySelector(s.imagen);
+    const precios = card.querySelector(s.precioContainer);
+    return {
+        titulo: texto(card.querySelector(s.titulo)),
+        link: enlace ? enlace.getAttribute('href') : null,
+        aria_label: enlace ? enlace.getAttribute('aria-label') : null,
+        imagen_url: imagen ? imagen.getAttribute('src') : null,
+        texto_precios: texto(precios),
+        precio_original: precios ? texto(precios.querySelector(s.precioOriginal)) : null,
+        precio_actual: precios ? texto(precios.querySelector(s.precioActual)) : null,
+        descuento: precios ? texto(precios.querySelector(s.descuento)) : null,
+        texto_card: card.textContent,
+    };
+});
+"""
+JS_HTML_GRILLA = """
+const grilla = document.querySelector(arguments[0]);
+return grilla ? grilla.outerHTML : null;
+"""
+SELECTORES_JS = {
+    "card": SELECTOR_CARD_WRAPPER,
+    "titulo": SELECTOR_TITULO,
+    "enlace": SELECTOR_ENLACE,
+    "imagen": SELECTOR_IMAGEN,
+    "precioContainer": SELECTOR_PRECIO_CONTAINER,
+    "precioOriginal": SELECTOR_PRECIO_ORIGINAL,
+    "precioActual": SELECTOR_PRECIO_ACTUAL,
+    "descuento": SELECTOR_DESCUENTO_TAG,
+}
+
+# =====================
+# Búsquedas por clase para el HTML (equivalentes a los SELECTOR_* de arriba)
+# =====================
+# clave -> (tag, fragmentos de clase); cada subárbol se recorre una sola vez
+BUSQUEDA_CARD = {
+    "titulo": ("span", (CLASE_TITULO,)),
+    "enlace": ("a", (CLASE_ENLACE,)),
+    "imagen": ("img", (CLASE_IMAGEN,)),
+    "precios": ("div", (CLASE_PRECIO_CONTAINER,)),
+}
+BUSQUEDA_PRECIOS = {
+    "original": ("span", (CLASE_PRECIO_ORIGINAL,)),
+    "actual": ("span", CLASES_PRECIO_ACTUAL),
+    "descuento": ("div", (CLASE_DESCUENTO_TAG,)),
+}
+
+
+def _precio_ars_a_float(precio_ars: str) -> Optional[float]:
+    """
+    Convierte un precio ya capturado por PRECIO_PATTERN (ej: 'ARS$ 1.234,56') a float
+    sin volver a limpiarlo con regex. Devuelve None si el formato no es el esperado.
+    """
+    try:
+        return float(precio_ars[4:].strip().replace('.', '').replace(',', '.'))
+    except ValueError:
+        return None
+
+
+# Pool de un solo hilo para escribir los HTML de depuración sin bloquear el scraping
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xbox-io")
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+
+def _guardar_html_en_segundo_plano(path: Path, contenido: Optional[str]) -> None:
+    """
+    Encola la escritura de un HTML de depuración en el hilo de E/S.
+    """
+    def _escribir() -> None:
+        try:
+            path.write_text(contenido or "", encoding="utf-8")
+            logger.info(f"HTML guardado en {path}")
+        except Exception as e:
+            logger.error(f"No se pudo guardar el HTML en {path}: {e}")
+    _IO_POOL.submit(_escribir)
+
+
+def _buscar_por_clase(element: etree._Element,
+                      busqueda: Dict[str, Tuple[str, Tuple[str, ...]]]) -> Dict[str, etree._Element]:
+    """
+    Recorre una sola vez los descendientes de un elemento y devuelve, para cada clave
+    de la búsqueda, el primer elemento con ese tag cuya clase contiene alguno de los fragmentos.
+    """
+    encontrados: Dict[str, etree._Element] = {}
+    pendientes = dict(busqueda)
+    for el in element.iterdescendants(*{tag for tag, _ in busqueda.values()}):
+        clase = el.get("class")
+        if not clase:
+            continue
+        for clave, (tag, fragmentos) in list(pendientes.items()):
+            if el.tag == tag and any(fragmento in clase for fragmento in fragmentos):
+                encontrados[clave] = el
+                del pendientes[clave]
+        if not pendientes:
+            break
+    return encontrados
+
+
+def _texto(element: etree._Element) -> str:
+    """
+    Devuelve el texto completo de un elemento y sus descendientes.
+    """
+    return "".join(element.itertext())
 
 # =====================
 # Tipos y Decoradores
 # =====================
 F = TypeVar('F', bound=Callable[..., Any])
 
-@dataclass
+
+class CamposCard(TypedDict, total=False):
+    """Textos y atributos crudos de una tarjeta, leídos del navegador o del HTML."""
+    titulo: Optional[str]
+    link: Optional[str]
+    aria_label: Optional[str]
+    imagen_url: Optional[str]
+    texto_precios: Optional[str]  # None si la tarjeta no tiene contenedor de precios
+    precio_original: Optional[str]
+    precio_actual: Optional[str]
+    descuento: Optional[str]
+    texto_card: str  # En el HTML no se incluye: se lee del elemento solo si hace falta
+
+
+@dataclass(slots=True)
 class GameData:
     """Representación de un juego de Xbox con sus datos."""
-    titulo: str = "Título no encontrado"
+    titulo: Optional[str] = None  # None si no se encontró; to_dict usa TITULO_NO_ENCONTRADO
     link: str = "Enlace no encontrado"
     imagen_url: str = "Imagen no encontrada"
     precio_num: Optional[float] = None
@@ -70,7 +278,17 @@ class GameData:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convierte el objeto a un diccionario."""
-        return {k: v for k, v in self.__dict__.items()}
+        return {
+            'titulo': self.titulo if self.titulo is not None else TITULO_NO_ENCONTRADO,
+            'link': self.link,
+            'imagen_url': self.imagen_url,
+            'precio_num': self.precio_num,
+            'precio_old_num': self.precio_old_num,
+            'precio_descuento_num': self.precio_descuento_num,
+            'precio_texto': self.precio_texto,
+            'precio_cambio': self.precio_cambio,
+            'precio_anterior_num': self.precio_anterior_num,
+        }
 
 
 def retry(max_attempts: int = MAX_RETRY_ATTEMPTS, delay: float = 1.0, backoff: float = 2.0, 
@@ -98,34 +316,79 @@ def retry(max_attempts: int = MAX_RETRY_ATTEMPTS, delay: float = 1.0, backoff: f
     return decorator
 
 
-@contextmanager
-def create_driver() -> Iterator[webdriver.Chrome]:
+@lru_cache(maxsize=1)
+def _chrome_options() -> webdriver.ChromeOptions:
     """
-    Context manager para la creación y cierre del driver de Selenium.
+    Construye una sola vez las opciones de Chrome compartidas por todos los drivers.
     """
     options = webdriver.ChromeOptions()
+    # driver.get vuelve en DOMContentLoaded; la espera de JS_PAGINA_LISTA decide cuándo está lista la grilla
+    options.page_load_strategy = "eager"
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-blink-features=AutomationControlled")
+    # Respaldo del bloqueo por CDP: no descargar ni decodificar imágenes
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # Caché HTTP en disco persistente entre ejecuciones (JS y CSS de la tienda)
+    options.add_argument(f"--disk-cache-dir={CACHE_DIR / 'chrome'}")
+    options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}")
     options.add_experimental_option('excludeSwitches', ['enable-automation'])
     options.add_experimental_option('useAutomationExtension', False)
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
+    return options
+
+
+@lru_cache(maxsize=1)
+def _chrome_service() -> Service:
+    """
+    Devuelve un Service de chromedriver reutilizable. La ruta se resuelve una sola vez
+    (PATH o Selenium Manager) y queda guardada en el objeto para los siguientes drivers.
+    """
+    ruta = shutil.which("chromedriver")
+    # Sin chromedriver en el PATH no se pasa la ruta (None rompe en versiones viejas de Selenium 4)
+    return Service(executable_path=ruta) if ruta else Service()
+
+
+def _opciones_conexion(debugger_address: str) -> webdriver.ChromeOptions:
+    """
+    Opciones para conectarse a un Chrome ya en ejecución en lugar de iniciar uno nuevo.
+    """
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = "eager"
+    options.debugger_address = debugger_address
+    return options
+
+
+def conectar_driver() -> Optional[webdriver.Chrome]:
+    """
+    Si CHROME_DEBUGGER_ADDRESS está definido, se conecta a ese navegador para no pagar
+    el arranque de Chrome en cada ejecución. Devuelve None si no hay dirección o falla.
+    El navegador no es del scraper: XboxScraper se desconecta sin cerrarlo.
+    """
+    if not CHROME_DEBUGGER_ADDRESS:
+        return None
+    logger.info(f"Conectando al navegador en {CHROME_DEBUGGER_ADDRESS}...")
+    try:
+        return webdriver.Chrome(service=_chrome_service(), options=_opciones_conexion(CHROME_DEBUGGER_ADDRESS))
+    except Exception as e:
+        logger.warning(f"No se pudo conectar al navegador en {CHROME_DEBUGGER_ADDRESS}: {e}. Iniciando uno nuevo.")
+        return None
+
+
+def create_driver() -> webdriver.Chrome:
+    """
+    Crea un nuevo driver de Selenium con Chrome en modo headless.
+    El ciclo de vida (reutilización y cierre) lo maneja XboxScraper.
+    """
     logger.info("Iniciando el navegador...")
-    driver = None
     try:
-        driver = webdriver.Chrome(options=options)
-        yield driver
+        return webdriver.Chrome(service=_chrome_service(), options=_chrome_options())
     except Exception as e:
         logger.error(f"Error al iniciar ChromeDriver: {e}")
         raise
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("Navegador cerrado correctamente.")
 
 
 class XboxScraper:
@@ -138,6 +401,52 @@ class XboxScraper:
         self.url = url
         self.max_juegos = max_juegos
         self.juegos_sin_info = 0  # Contador para juegos sin información completa
+        self._driver: Optional[webdriver.Chrome] = None  # Driver reutilizado entre ejecuciones
+        self._driver_conectado = False  # True si el navegador es externo (CHROME_DEBUGGER_ADDRESS)
+        # Índice de datos previos por título exacto: (objeto datos_previos, índice)
+        self._indice_previos: Optional[tuple] = None
+
+    def _obtener_driver(self) -> webdriver.Chrome:
+        """
+        Devuelve el driver reutilizable, creándolo si no existe o si se perdió la sesión.
+        Entre ejecuciones se limpian las cookies en lugar de reiniciar el navegador.
+        """
+        if self._driver is not None:
+            try:
+                # También sirve de verificación: falla si el navegador se cerró o la sesión expiró
+                self._driver.delete_all_cookies()
+                logger.info("Reutilizando el navegador existente.")
+                return self._driver
+            except WebDriverException as e:
+                logger.warning(f"La sesión del navegador ya no responde, se creará una nueva: {e}")
+                self.cerrar_driver()
+        driver = conectar_driver()
+        self._driver_conectado = driver is not None
+        self._driver = driver or create_driver()
+        # El hook solo vive mientras haya un navegador abierto (cerrar_driver lo quita)
+        atexit.register(self.cerrar_driver)
+        return self._driver
+
+    def cerrar_driver(self) -> None:
+        """
+        Cierra el navegador si está abierto. Si es un navegador externo solo se desconecta:
+        detiene el chromedriver propio y deja el navegador abierto.
+        """
+        if self._driver is None:
+            return
+        try:
+            if self._driver_conectado:
+                self._driver.service.stop()
+                logger.info("Desconectado del navegador externo (queda abierto).")
+            else:
+                self._driver.quit()
+                logger.info("Navegador cerrado correctamente.")
+        except Exception as e:
+            logger.warning(f"Error al cerrar el navegador: {e}")
+        finally:
+            self._driver = None
+            self._driver_conectado = False
+            atexit.unregister(self.cerrar_driver)
 
     @retry(max_attempts=MAX_RETRY_ATTEMPTS, delay=5.0)
     def cargar_pagina_inicial(self, driver: webdriver.Chrome) -> bool:
@@ -145,28 +454,26 @@ class XboxScraper:
         Carga la página inicial y configura la navegación.
         """
         logger.info(f"Cargando página: {self.url}")
-        driver.get(self.url)
-        WebDriverWait(driver, REQUEST_TIMEOUT/2).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
-        # Intentar aceptar cookies si aparece el banner
         try:
-            WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, XPATH_BOTON_COOKIES))
-            ).click()
-            logger.info("Banner de cookies aceptado.")
-        except TimeoutException:
-            logger.info("No se encontró el banner de cookies o ya fue aceptado.")
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": URLS_BLOQUEADAS})
         except Exception as e:
-            logger.warning(f"Error al aceptar cookies: {e}")
-        # Esperar a que cargue la grilla de juegos
+            logger.warning(f"No se pudo configurar el bloqueo de recursos: {e}")
+        driver.get(self.url)
+        # Una sola espera: banner de cookies, grilla y primera tarjeta visible
         try:
-            WebDriverWait(driver, REQUEST_TIMEOUT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_GRID_CONTAINER))
-            )
-            WebDriverWait(driver, 15).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, SELECTOR_CARD_WRAPPER))
+            estado = WebDriverWait(driver, REQUEST_TIMEOUT).until(
+                lambda d: d.execute_script(
+                    JS_PAGINA_LISTA, SELECTOR_GRID_CONTAINER, SELECTOR_CARD_WRAPPER, ID_BOTON_COOKIES
+                )
             )
+            if estado.get("cookiesAceptadas"):
+                logger.info("Banner de cookies aceptado.")
+            else:
+                logger.info("No se encontró el banner de cookies o ya fue aceptado.")
+            driver.execute_script(JS_INSTALAR_CONTADOR_ITEMS, SELECTOR_CARD_WRAPPER)
+            # Margen para las esperas con execute_async_script (JS_ESPERAR_NUEVOS_ITEMS)
+            driver.set_script_timeout(REQUEST_TIMEOUT)
             logger.info("Grilla de juegos cargada correctamente.")
             return True
         except TimeoutException:
@@ -174,8 +481,7 @@ class XboxScraper:
             from scrap.config import HTML_DEBUG_DIR, get_formatted_datetime
             timestamp = get_formatted_datetime("%Y%m%d_%H%M%S")
             error_html_path = HTML_DEBUG_DIR / f"xbox_page_source_error_{timestamp}.html"
-            error_html_path.write_text(driver.page_source, encoding="utf-8")
-            logger.error(f"HTML guardado en {error_html_path}")
+            _guardar_html_en_segundo_plano(error_html_path, driver.page_source)
             return False
 
     def scrape_xbox_games(self, datos_previos: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -184,22 +490,24 @@ class XboxScraper:
         """
         self.juegos_sin_info = 0
         try:
-            with create_driver() as driver:
-                if not self.cargar_pagina_inicial(driver):
-                    logger.error("No se pudo cargar la página inicial.")
-                    return []
-                games_data = self._cargar_mas_juegos(driver)
-                if datos_previos:
-                    logger.info(f"Comparando con datos previos... (formato: {'con clave juegos' if 'juegos' in datos_previos else 'diccionario por título'})")
-                    self._comparar_con_datos_previos_bulk(games_data, datos_previos)
-                    self._debug_comparacion_precios(games_data, datos_previos)
-                else:
-                    logger.info("No hay datos previos para comparar")
-                if self.juegos_sin_info > 0:
-                    logger.info(f"No se pudo obtener información completa de {self.juegos_sin_info} juegos de un total de {len(games_data)}.")
-                return [game.to_dict() for game in games_data]
+            driver = self._obtener_driver()
+            if not self.cargar_pagina_inicial(driver):
+                logger.error("No se pudo cargar la página inicial.")
+                return []
+            games_data = self._cargar_mas_juegos(driver)
+            if datos_previos:
+                logger.info(f"Comparando con datos previos... (formato: {'con clave juegos' if 'juegos' in datos_previos else 'diccionario por título'})")
+                self._comparar_con_datos_previos_bulk(games_data, datos_previos)
+                self._debug_comparacion_precios(games_data, datos_previos)
+            else:
+                logger.info("No hay datos previos para comparar")
+            if self.juegos_sin_info > 0:
+                logger.info(f"No se pudo obtener información completa de {self.juegos_sin_info} juegos de un total de {len(games_data)}.")
+            return [game.to_dict() for game in games_data]
         except Exception as e:
             logger.error(f"Error durante el scraping: {e}", exc_info=True)
+            # Descartar el navegador: puede haber quedado en un estado inconsistente
+            self.cerrar_driver()
             return []
 
     def _cargar_mas_juegos(self, driver: webdriver.Chrome) -> List[GameData]:
@@ -210,12 +518,8 @@ class XboxScraper:
         last_item_count = 0
         adaptive_wait_time = 1.5
         while consecutive_failures < MAX_FALLOS_CONSECUTIVOS:
-            try:
-                current_items_count = len(driver.find_elements(By.CSS_SELECTOR, SELECTOR_CARD_WRAPPER))
-                logger.info(f"Items actualmente cargados: {current_items_count}")
-            except StaleElementReferenceException:
-                time.sleep(adaptive_wait_time)
-                continue
+            current_items_count = self._contar_items(driver)
+            logger.info(f"Items actualmente cargados: {current_items_count}")
             if current_items_count >= self.max_juegos:
                 logger.info(f"Límite de {self.max_juegos} juegos alcanzado. Deteniendo carga.")
                 break
@@ -231,7 +535,9 @@ class XboxScraper:
                 if load_more_button:
                     self._hacer_click_seguro(driver, load_more_button)
                     logger.info("Botón 'Cargar más' presionado.")
-                    self._esperar_nuevos_elementos(driver, last_item_count)
+                    if self._esperar_nuevos_elementos(driver, last_item_count) >= self.max_juegos:
+                        logger.info(f"Límite de {self.max_juegos} juegos alcanzado. Deteniendo carga.")
+                        break
                 else:
                     logger.info("Botón 'Cargar más' no encontrado. Posiblemente se cargaron todos los juegos.")
                     consecutive_failures += 1
@@ -239,36 +545,34 @@ class XboxScraper:
                 logger.info("Timeout al buscar/presionar 'Cargar más'.")
                 consecutive_failures += 1
                 driver.execute_script("window.scrollBy(0, window.innerHeight);")
-                time.sleep(adaptive_wait_time)
+                self._esperar_avance_pagina(driver, last_item_count, adaptive_wait_time)
             except Exception as e:
                 logger.error(f"Error en bucle 'Cargar más': {e}")
                 consecutive_failures += 1
-                time.sleep(adaptive_wait_time)
+                self._esperar_avance_pagina(driver, last_item_count, adaptive_wait_time)
             if consecutive_failures >= MAX_FALLOS_CONSECUTIVOS:
                 break
-        # Guardar el HTML para depuración
-        page_source = driver.page_source
-        from scrap.config import HTML_DEBUG_DIR, get_formatted_datetime
-        timestamp = get_formatted_datetime("%Y%m%d_%H%M%S")
-        html_path = HTML_DEBUG_DIR / f"xbox_page_source_{timestamp}.html"
-        html_path.write_text(page_source if page_source else "", encoding="utf-8")
-        Path("xbox_page_source.html").write_text(page_source if page_source else "", encoding="utf-8")
-        logger.info(f"HTML guardado en {html_path}")
-        return self._procesar_datos_juegos(page_source)
+        # Guardar el HTML para depuración solo si se pidió explícitamente
+        if DEBUG_SAVE_HTML:
+            from scrap.config import HTML_DEBUG_DIR, get_formatted_datetime
+            timestamp = get_formatted_datetime("%Y%m%d_%H%M%S")
+            html_path = HTML_DEBUG_DIR / f"xbox_page_source_{timestamp}.html"
+            _guardar_html_en_segundo_plano(html_path, driver.page_source)
+        return self._extraer_juegos(driver)
 
     def _encontrar_boton_cargar_mas(self, driver: webdriver.Chrome) -> Optional[webdriver.remote.webelement.WebElement]:
         """
         Encuentra el botón 'Cargar más' y hace scroll hacia él.
         """
         try:
-            load_more_button = WebDriverWait(driver, REQUEST_TIMEOUT/3).until(
+            load_more_button = WebDriverWait(driver, REQUEST_TIMEOUT/3, poll_frequency=POLL_FRECUENCIA).until(
                 EC.presence_of_element_located((By.XPATH, XPATH_BOTON_CARGAR_MAS))
             )
             driver.execute_script(
                 "arguments[0].scrollIntoView({behavior: 'auto', block: 'center', inline: 'nearest'});", 
                 load_more_button
             )
-            return WebDriverWait(driver, REQUEST_TIMEOUT/6).until(
+            return WebDriverWait(driver, REQUEST_TIMEOUT/6, poll_frequency=POLL_FRECUENCIA).until(
                 EC.element_to_be_clickable((By.XPATH, XPATH_BOTON_CARGAR_MAS))
             )
         except (TimeoutException, NoSuchElementException):
@@ -283,39 +587,126 @@ class XboxScraper:
         except ElementClickInterceptedException:
             driver.execute_script("arguments[0].click();", elemento)
 
-    def _esperar_nuevos_elementos(self, driver: webdriver.Chrome, ultimo_conteo: int) -> None:
+    def _contar_items(self, driver: webdriver.Chrome) -> int:
+        """
+        Devuelve la cantidad de tarjetas de juegos cargadas, leída del contador en el navegador.
+        """
+        return int(driver.execute_script(JS_CONTAR_ITEMS, SELECTOR_CARD_WRAPPER) or 0)
+
+    def _esperar_avance_pagina(self, driver: webdriver.Chrome, ultimo_conteo: int, timeout: float) -> None:
+        """
+        Espera como máximo `timeout` segundos antes de reintentar la carga, pero vuelve
+        apenas aparecen tarjetas nuevas.
+        """
+        def _pagina_avanzo(d: webdriver.Chrome) -> bool:
+            return self._contar_items(d) > ultimo_conteo
+
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=POLL_FRECUENCIA).until(_pagina_avanzo)
+        except TimeoutException:
+            pass
+        except Exception as e:
+            logger.debug(f"Error esperando el avance de la página: {e}")
+
+    def _esperar_nuevos_elementos(self, driver: webdriver.Chrome, ultimo_conteo: int) -> int:
         """
         Espera a que se carguen nuevos elementos tras hacer clic en 'Cargar más'.
+        La espera ocurre en el navegador (MutationObserver), con una sola llamada al driver.
+        Devuelve el conteo observado, o el último conocido si no llegaron elementos nuevos.
         """
         try:
-            WebDriverWait(driver, REQUEST_TIMEOUT / 2).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, SELECTOR_CARD_WRAPPER)) > ultimo_conteo
-            )
-            logger.info(f"Nuevos items cargados. Total ahora: {len(driver.find_elements(By.CSS_SELECTOR, SELECTOR_CARD_WRAPPER))}")
-            time.sleep(1)
+            nuevo_conteo = int(driver.execute_async_script(
+                JS_ESPERAR_NUEVOS_ITEMS, ultimo_conteo, int(REQUEST_TIMEOUT / 2 * 1000), SELECTOR_CARD_WRAPPER
+            ))
         except TimeoutException:
+            nuevo_conteo = -1
+        if nuevo_conteo <= ultimo_conteo:
             logger.warning("No se detectaron nuevos elementos después de hacer clic en 'Cargar más'")
+            return ultimo_conteo
+        logger.info(f"Nuevos items cargados. Total ahora: {nuevo_conteo}")
+        # Esperar a que el lote termine de renderizar, también el último: es el que se extrae a continuación
+        self._esperar_dom_estable(driver)
+        return nuevo_conteo
+
+    def _esperar_dom_estable(self, driver: webdriver.Chrome, quietud_ms: int = 250, timeout: float = 1.0) -> None:
+        """
+        Espera a que el DOM deje de cambiar durante `quietud_ms` en lugar de dormir un tiempo fijo.
+        Nunca espera más de `timeout` segundos.
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=POLL_FRECUENCIA).until(
+                lambda d: d.execute_script(JS_DOM_ESTABLE, quietud_ms)
+            )
+        except TimeoutException:
+            logger.debug("El DOM siguió cambiando; se continúa sin esperar más.")
+
+    def _extraer_juegos(self, driver: webdriver.Chrome) -> List[GameData]:
+        """
+        Extrae los datos de todas las tarjetas con un único execute_script, sin transferir
+        ni parsear el HTML completo. Si falla, recurre a procesar page_source.
+        """
+        try:
+            campos_juegos = driver.execute_script(JS_EXTRAER_JUEGOS, SELECTORES_JS)
+        except Exception as e:
+            logger.warning(f"No se pudieron extraer los juegos desde el navegador ({e}). Procesando el HTML de la grilla.")
+            return self._procesar_datos_juegos(self._html_grilla(driver))
+        return self._procesar_campos_juegos(campos_juegos or [])
+
+    def _html_grilla(self, driver: webdriver.Chrome) -> str:
+        """
+        Devuelve solo el HTML de la grilla de juegos, o el de la página completa si no se encuentra.
+        """
+        try:
+            html_grilla = driver.execute_script(JS_HTML_GRILLA, SELECTOR_GRID_CONTAINER)
+        except Exception as e:
+            logger.debug(f"No se pudo obtener el HTML de la grilla: {e}")
+            html_grilla = None
+        return html_grilla or driver.page_source
+
+    def _procesar_campos_juegos(self, campos_juegos: List[CamposCard]) -> List[GameData]:
+        """
+        Construye los juegos a partir de los campos extraídos en el navegador.
+        """
+        juegos_procesados = []
+        for campos in campos_juegos:
+            try:
+                juegos_procesados.append(self._crear_game(campos))
+            except Exception as exc:
+                logger.error(f"Error procesando juego: {exc}", exc_info=True)
+                self.juegos_sin_info += 1
+        logger.info(f"Total de juegos procesados: {len(juegos_procesados)} | Juegos sin información completa: {self.juegos_sin_info}")
+        return juegos_procesados
 
     def _procesar_datos_juegos(self, page_source: str) -> List[GameData]:
         """
         Procesa el HTML de la página para extraer información de los juegos.
-        Utiliza ThreadPoolExecutor para procesamiento paralelo.
+        El procesamiento es secuencial: el recorrido del árbol retiene el GIL,
+        por lo que un pool de hilos solo agregaba overhead.
         """
-        soup = BeautifulSoup(page_source, 'html.parser')
         juegos_procesados = []
-        items = soup.select(SELECTOR_CARD_WRAPPER)
-        logger.info(f"Procesando {len(items)} juegos encontrados en el HTML")
-        with ThreadPoolExecutor(max_workers=min(10, os.cpu_count() * 2)) as executor:
-            futures = {executor.submit(self._extraer_datos_juego, item): item for item in items}
-            for future in as_completed(futures):
-                try:
-                    game_data = future.result()
-                    if game_data:
-                        juegos_procesados.append(game_data)
-                except Exception as exc:
-                    item = futures[future]
-                    logger.error(f"Error procesando juego: {exc}", exc_info=True)
-                    self.juegos_sin_info += 1
+        if not page_source:
+            logger.warning("El HTML de la página está vacío, no hay juegos para procesar")
+            return juegos_procesados
+        # Parseo incremental: cada tarjeta se procesa al cerrarse y luego se libera,
+        # así la memoria no crece con el tamaño total del documento.
+        contexto = etree.iterparse(
+            io.BytesIO(page_source.encode("utf-8")),
+            events=("end",), tag="div", html=True, encoding="utf-8"
+        )
+        for _, item in contexto:
+            if CLASE_CARD_WRAPPER not in (item.get("class") or ""):
+                continue
+            try:
+                game_data = self._extraer_datos_juego(item)
+                if game_data:
+                    juegos_procesados.append(game_data)
+            except Exception as exc:
+                logger.error(f"Error procesando juego: {exc}", exc_info=True)
+                self.juegos_sin_info += 1
+            finally:
+                item.clear(keep_tail=True)
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
         logger.info(f"Total de juegos procesados: {len(juegos_procesados)} | Juegos sin información completa: {self.juegos_sin_info}")
         return juegos_procesados
 
@@ -323,79 +714,107 @@ class XboxScraper:
     # Métodos de extracción y utilidades privadas
     # =====================
     PRECIO_PATTERN = re.compile(r"Precio original:\s*(ARS\$\s*[\d\.,]+);\s*en oferta por\s*(ARS\$\s*[\d\.,]+)", re.IGNORECASE)
-
-    @staticmethod
-    @lru_cache(maxsize=32)
-    def _extract_element_text(element, selector):
-        """
-        Extrae el texto de un elemento usando un selector CSS. Usa caché para mejorar el rendimiento.
-        """
-        if not element:
-            return None
-        selected = element.select_one(selector)
-        return selected.text.strip() if selected else None
-
-    def _extraer_datos_juego(self, item: Tag) -> GameData:
-        """
-        Extrae los datos de un elemento de juego individual.
+    # El grupo 1 captura 'gratis'; cualquier otra coincidencia indica Game Pass
+    PRECIO_ESPECIAL_CONTENEDOR_PATTERN = re.compile(r"(gratis)|incluido con|game pass", re.IGNORECASE)
+    PRECIO_ESPECIAL_TEXTO_PATTERN = re.compile(r"(gratis)|game pass", re.IGNORECASE)
+    GRATIS_PATTERN = re.compile(r"gratis", re.IGNORECASE)
+
+    def _extraer_datos_juego(self, item: etree._Element) -> GameData:
+        """
+        Extrae los datos de un elemento de juego individual del HTML.
+        """
+        return self._crear_game(self._campos_desde_elemento(item), item)
+
+    def _campos_desde_elemento(self, item: etree._Element) -> CamposCard:
+        """
+        Lee los textos y atributos de una tarjeta del HTML, con la misma forma que JS_EXTRAER_JUEGOS.
+        """
+        elementos = _buscar_por_clase(item, BUSQUEDA_CARD)
+        titulo_tag = elementos.get("titulo")
+        link_tag = elementos.get("enlace")
+        img_tag = elementos.get("imagen")
+        price_container = elementos.get("precios")
+        campos: CamposCard = {
+            "titulo": _texto(titulo_tag) if titulo_tag is not None else None,
+            "link": link_tag.get('href') if link_tag is not None else None,
+            "aria_label": link_tag.get('aria-label') if link_tag is not None else None,
+            "imagen_url": img_tag.get('src') if img_tag is not None else None,
+        }
+        if price_container is not None:
+            elementos_precio = _buscar_por_clase(price_container, BUSQUEDA_PRECIOS)
+            original_price_span = elementos_precio.get("original")
+            current_price_span = elementos_precio.get("actual")
+            discount_tag_span = elementos_precio.get("descuento")
+            campos["texto_precios"] = _texto(price_container)
+            campos["precio_original"] = _texto(original_price_span) if original_price_span is not None else None
+            campos["precio_actual"] = _texto(current_price_span) if current_price_span is not None else None
+            campos["descuento"] = _texto(discount_tag_span) if discount_tag_span is not None else None
+        return campos
+
+    def _crear_game(self, campos: CamposCard, item: Optional[etree._Element] = None) -> GameData:
+        """
+        Construye un GameData a partir de los campos crudos de una tarjeta.
+        Si se pasa el elemento HTML, el texto completo de la tarjeta se lee de él solo cuando hace falta.
         """
         game = GameData()
-        titulo = self._extract_element_text(item, SELECTOR_TITULO)
+        titulo = (campos.get("titulo") or "").strip()
         if titulo:
             game.titulo = titulo
-        link_tag = item.select_one(SELECTOR_ENLACE)
-        if link_tag and link_tag.get('href'):
-            game.link = link_tag.get('href')
-        img_tag = item.select_one(SELECTOR_IMAGEN)
-        if img_tag and img_tag.get('src'):
-            game.imagen_url = img_tag.get('src')
-        self._extraer_info_precios(item, game, link_tag)
-        if game.precio_texto == "Precio no disponible" or game.titulo == "Título no encontrado":
+        if campos.get("link"):
+            game.link = campos["link"]
+        if campos.get("imagen_url"):
+            game.imagen_url = campos["imagen_url"]
+        self._extraer_info_precios(game, campos, item)
+        if game.precio_texto == "Precio no disponible" or game.titulo is None:
             self.juegos_sin_info += 1
         return game
 
-    def _extraer_info_precios(self, item: Tag, game: GameData, link_tag: Optional[Tag] = None) -> None:
+    def _extraer_info_precios(self, game: GameData, campos: CamposCard, item: Optional[etree._Element] = None) -> None:
         """
-        Extrae la información de precios de un item de juego.
+        Extrae la información de precios de los campos de una tarjeta.
         """
-        price_container = item.select_one(SELECTOR_PRECIO_CONTAINER)
-        if not price_container:
+        texto_precios = campos.get("texto_precios")
+        if texto_precios is None:
             return
-        original_price_span = price_container.select_one(SELECTOR_PRECIO_ORIGINAL)
-        current_price_span = price_container.select_one(SELECTOR_PRECIO_ACTUAL)
-        discount_tag_span = price_container.select_one(SELECTOR_DESCUENTO_TAG)
-        if original_price_span and current_price_span:
+        original_price_text = campos.get("precio_original")
+        current_price_text = campos.get("precio_actual")
+        if original_price_text is not None and current_price_text is not None:
             self._procesar_precio_con_descuento(
-                game, original_price_span, current_price_span, discount_tag_span, link_tag
+                game, original_price_text.strip(), current_price_text.strip(),
+                campos.get("descuento"), campos.get("aria_label")
             )
-        elif current_price_span:
-            current_price_text = current_price_span.text.strip()
+        elif current_price_text is not None:
+            current_price_text = current_price_text.strip()
             game.precio_num = clean_price_to_float(current_price_text)
             game.precio_texto = current_price_text
-        self._detectar_precios_especiales(game, price_container)
+        self._detectar_precios_especiales(game, texto_precios)
         if (game.precio_texto == "Precio no disponible" or 
             (game.precio_num is None and "ARS$" not in game.precio_texto and 
              game.precio_texto != "Incluido con Game Pass")):
-            self._detectar_precios_en_texto_completo(game, item)
+            texto_card = campos.get("texto_card")
+            if texto_card is None and item is not None:
+                texto_card = _texto(item)
+            self._detectar_precios_en_texto_completo(game, texto_card or "")
 
     def _procesar_precio_con_descuento(self, 
                                       game: GameData, 
-                                      original_price_span: Tag, 
-                                      current_price_span: Tag, 
-                                      discount_tag_span: Optional[Tag], 
-                                      link_tag: Optional[Tag]) -> None:
+                                      original_price_text: str,
+                                      current_price_text: str,
+                                      discount_text: Optional[str],
+                                      aria_label: Optional[str]) -> None:
         """
         Procesa los precios cuando hay un descuento aplicado.
         """
-        original_price_text = original_price_span.text.strip()
-        current_price_text = current_price_span.text.strip()
-        game.precio_old_num = clean_price_to_float(original_price_text)
-        game.precio_num = clean_price_to_float(current_price_text)
-        if discount_tag_span:
-            game.precio_descuento_num = extract_discount_percentage(discount_tag_span.text.strip())
-        if link_tag and link_tag.get('aria-label'):
-            aria_label = link_tag.get('aria-label')
-            match_aria = self.PRECIO_PATTERN.search(aria_label)
+        # Chequeo literal previo (sin distinguir mayúsculas, como PRECIO_PATTERN): evita ejecutar la regex en etiquetas sin oferta
+        match_aria = self.PRECIO_PATTERN.search(aria_label) if aria_label and "en oferta por" in aria_label.lower() else None
+        # La misma coincidencia del aria-label trae ambos precios; los textos de los spans son el respaldo
+        precio_old = _precio_ars_a_float(match_aria.group(1)) if match_aria else None
+        precio = _precio_ars_a_float(match_aria.group(2)) if match_aria else None
+        game.precio_old_num = precio_old if precio_old is not None else clean_price_to_float(original_price_text)
+        game.precio_num = precio if precio is not None else clean_price_to_float(current_price_text)
+        if discount_text is not None:
+            game.precio_descuento_num = extract_discount_percentage(discount_text.strip())
+        if aria_label:
             if match_aria:
                 game.precio_texto = f"Antes: {match_aria.group(1).strip()}, Ahora: {match_aria.group(2).strip()}"
                 if game.precio_descuento_num:
@@ -407,68 +826,75 @@ class XboxScraper:
         else:
             game.precio_texto = f"Antes: {original_price_text}, Ahora: {current_price_text}"
 
-    def _detectar_precios_especiales(self, game: GameData, price_container: Tag) -> None:
+    def _detectar_precios_especiales(self, game: GameData, texto_precios: str) -> None:
         """
         Detecta precios especiales como 'Gratis' o 'Game Pass'.
         """
         if game.precio_num is None and (game.precio_texto == "Precio no disponible" or "ARS$" not in game.precio_texto):
-            container_text_lower = price_container.text.lower()
-            if "gratis" in container_text_lower:
-                game.precio_texto = "Gratis"
-                game.precio_num = 0.0
-            elif "incluido con" in container_text_lower or "game pass" in container_text_lower:
-                game.precio_texto = "Incluido con Game Pass"
+            self._aplicar_precio_especial(game, texto_precios, self.PRECIO_ESPECIAL_CONTENEDOR_PATTERN)
+
+    def _detectar_precios_en_texto_completo(self, game: GameData, texto_card: str) -> None:
+        """
+        Busca precios en todo el texto de la tarjeta cuando no se detectó en el contenedor principal.
+        """
+        self._aplicar_precio_especial(game, texto_card, self.PRECIO_ESPECIAL_TEXTO_PATTERN)
 
-    def _detectar_precios_en_texto_completo(self, game: GameData, item: Tag) -> None:
+    def _aplicar_precio_especial(self, game: GameData, texto: str, pattern: re.Pattern) -> None:
         """
-        Busca precios en todo el texto del elemento cuando no se detectó en el contenedor principal.
+        Asigna 'Gratis' o 'Incluido con Game Pass' según el texto, en una sola búsqueda.
+        'Gratis' tiene prioridad aunque aparezca después de la mención a Game Pass.
         """
-        item_text_lower = item.text.lower()
-        if "gratis" in item_text_lower:
+        match = pattern.search(texto)
+        if match is None:
+            return
+        if match.group(1) or self.GRATIS_PATTERN.search(texto, match.end()):
             game.precio_texto = "Gratis"
             game.precio_num = 0.0
-        elif "incluido con game pass" in item_text_lower or "game pass" in item_text_lower:
+        else:
             game.precio_texto = "Incluido con Game Pass"
 
     def _comparar_con_datos_previos_bulk(self, 
                                         games_data: List[GameData], 
                                         datos_previos: Dict[str, Any]) -> None:
         """
-        Compara los datos de múltiples juegos con los datos previos en paralelo.
+        Compara los datos de múltiples juegos con los datos previos.
         """
         if not datos_previos:
             logger.info("No hay datos previos para comparar precios.")
             return
+        juegos_prev_dict = self._indice_datos_previos(datos_previos)
         if "juegos" in datos_previos and isinstance(datos_previos["juegos"], list):
-            juegos_prev = datos_previos.get("juegos", [])
-            juegos_prev_dict = {juego.get("titulo", ""): juego for juego in juegos_prev}
-            logger.info(f"Comparando precios con datos previos (formato antiguo) de {len(juegos_prev)} juegos...")
+            logger.info(f"Comparando precios con datos previos (formato antiguo) de {len(datos_previos['juegos'])} juegos...")
         else:
-            juegos_prev_dict = datos_previos
-            logger.info(f"Comparando precios con datos previos de {len(juegos_prev_dict)} juegos...")
-        juegos_con_titulo = [game for game in games_data if game.titulo != "Título no encontrado"]
+            logger.info(f"Comparando precios con datos previos de {len(datos_previos)} juegos...")
+        juegos_con_titulo = [game for game in games_data if game.titulo is not None]
         if len(juegos_con_titulo) < len(games_data):
             logger.info(f"Se omitieron {len(games_data) - len(juegos_con_titulo)} juegos sin título en la comparación de precios.")
-        with ThreadPoolExecutor(max_workers=min(10, os.cpu_count() * 2)) as executor:
-            futures_to_games = {
-                executor.submit(
-                    self._comparar_juego_individual, 
-                    game, 
-                    juegos_prev_dict.get(game.titulo)
-                ): game for game in juegos_con_titulo
-            }
-            for future in as_completed(futures_to_games):
-                try:
-                    future.result()
-                except Exception as exc:
-                    game = futures_to_games[future]
-                    logger.error(f"Error comparando juego '{game.titulo}': {exc}")
+        for game in juegos_con_titulo:
+            try:
+                self._comparar_juego_individual(game, juegos_prev_dict.get(game.titulo))
+            except Exception as exc:
+                logger.error(f"Error comparando juego '{game.titulo}': {exc}")
+
+    def _indice_datos_previos(self, datos_previos: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Devuelve los juegos previos indexados por título exacto (títulos que solo difieren
+        en mayúsculas son productos distintos). El índice se construye una sola vez por cada objeto datos_previos.
+        """
+        if self._indice_previos is not None and self._indice_previos[0] is datos_previos:
+            return self._indice_previos[1]
+        if "juegos" in datos_previos and isinstance(datos_previos["juegos"], list):
+            indice = {juego.get("titulo", ""): juego for juego in datos_previos["juegos"]}
+        else:
+            indice = datos_previos
+        self._indice_previos = (datos_previos, indice)
+        return indice
 
     def _comparar_juego_individual(self, game: GameData, juego_previo: Optional[Dict[str, Any]]) -> None:
         """
         Compara un juego individual con los datos previos.
         """
-        if game.titulo == "Título no encontrado":
+        if game.titulo is None:
             logger.debug("Omitiendo comparación para juego sin título")
             return
         if not juego_previo:
@@ -484,14 +910,17 @@ class XboxScraper:
     def _debug_comparacion_precios(self, games_data: List[GameData], datos_previos: Dict[str, Any]) -> None:
         """
         Método de diagnóstico para depurar problemas con la comparación de precios.
+        Solo registra a nivel INFO, así que no hace nada si ese nivel está deshabilitado.
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if not datos_previos:
             logger.debug("No hay datos previos para depurar comparación")
             return
         total_juegos = len(games_data)
         juegos_con_datos_previos = 0
         juegos_con_cambio_precio = 0
-        juegos_sin_titulo = sum(1 for game in games_data if game.titulo == "Título no encontrado")
+        juegos_sin_titulo = sum(1 for game in games_data if game.titulo is None)
         if juegos_sin_titulo > 0:
             logger.info(f"Diagnóstico: {juegos_sin_titulo} juegos sin título detectados (serán omitidos en la comparación)")
         tiene_clave_juegos = "juegos" in datos_previos and isinstance(datos_previos["juegos"], list)
@@ -501,16 +930,9 @@ class XboxScraper:
         else:
             formato = "nuevo (diccionario por título)"
             juegos_previos_count = len(datos_previos)
+        indice = self._indice_datos_previos(datos_previos)
         for game in games_data[:10]:
-            titulo = game.titulo
-            encontrado = False
-            if tiene_clave_juegos:
-                for juego in datos_previos["juegos"]:
-                    if juego.get("titulo") == titulo:
-                        encontrado = True
-                        break
-            else:
-                encontrado = titulo in datos_previos
+            encontrado = game.titulo in indice
             if encontrado:
                 juegos_con_datos_previos += 1
                 if game.precio_cambio:
@@ -520,12 +942,22 @@ class XboxScraper:
                     f"{juegos_con_cambio_precio}/10 tienen cambio de precio detectado")
 
 
-@lru_cache(maxsize=1)
+_scraper: Optional[XboxScraper] = None
+_scraper_lock = threading.Lock()
+
+
 def get_scraper(url: str = URL_XBOX_TIENDA, max_juegos: int = MAX_JUEGOS) -> XboxScraper:
     """
-    Obtiene una instancia única del scraper (patrón Singleton con cache).
+    Obtiene la instancia única del scraper (patrón Singleton).
+    Si se pide otra URL o máximo de juegos, cierra el navegador de la instancia anterior antes de reemplazarla.
     """
-    return XboxScraper(url, max_juegos)
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None or _scraper.url != url or _scraper.max_juegos != max_juegos:
+            if _scraper is not None:
+                _scraper.cerrar_driver()
+            _scraper = XboxScraper(url, max_juegos)
+        return _scraper
 
 
 def scrape_xbox_games(datos_previos: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
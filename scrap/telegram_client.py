@@ -3,13 +3,31 @@ Cliente para enviar notificaciones por Telegram.
 Proporciona funciones para enviar mensajes y verificar la configuración.
 """
 import asyncio
-from typing import Dict, Any, List
+from datetime import timedelta
+from typing import Dict, Any, List, Optional
 from telegram import Bot
-from telegram.error import TelegramError, TimedOut, NetworkError
+from telegram.error import TelegramError, TimedOut, NetworkError, RetryAfter
 from telegram.constants import ParseMode
 
 from scrap.config import BOT_TOKEN, CHAT_ID, logger, MAX_RETRY_ATTEMPTS
 
+# Bot compartido y el event loop en el que se creó (ver _obtener_bot)
+_bot: Optional[Bot] = None
+_bot_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _obtener_bot() -> Bot:
+    """
+    Devuelve un Bot compartido para reutilizar su conexión HTTP entre envíos.
+    Si cambió el event loop (por ejemplo, entre llamadas a asyncio.run) se crea uno nuevo,
+    porque el cliente HTTP del bot queda ligado al loop en el que se usó.
+    """
+    global _bot, _bot_loop
+    loop = asyncio.get_running_loop()
+    if _bot is None or _bot_loop is not loop:
+        _bot = Bot(token=BOT_TOKEN)
+        _bot_loop = loop
+    return _bot
+
 def _dividir_mensaje_largo(mensaje: str, limite: int = 4000) -> List[str]:
     """
     Divide un mensaje largo en fragmentos más pequeños para cumplir con las limitaciones de Telegram.
@@ -25,31 +43,42 @@ def _dividir_mensaje_largo(mensaje: str, limite: int = 4000) -> List[str]:
     if len(mensaje) <= limite:
         return [mensaje]
     
-    # Dividir el mensaje en fragmentos
+    # Dividir el mensaje en fragmentos: las líneas se acumulan en una lista y se unen
+    # una sola vez por fragmento, en lugar de concatenar strings línea a línea
     fragmentos = []
-    lineas = mensaje.split('\n')
-    fragmento_actual = ""
+    lineas_actuales: List[str] = []
+    largo_actual = 0  # Largo de "\n".join(lineas_actuales)
     
-    for linea in lineas:
+    for linea in mensaje.split('\n'):
         # Si agregar esta línea excede el límite, comenzar un nuevo fragmento
-        if len(fragmento_actual) + len(linea) + 1 > limite:
-            if fragmento_actual:
-                fragmentos.append(fragmento_actual)
-            fragmento_actual = linea
+        if largo_actual + len(linea) + 1 > limite:
+            if largo_actual:
+                fragmentos.append("\n".join(lineas_actuales))
+            lineas_actuales, largo_actual = [linea], len(linea)
+        elif largo_actual:
+            lineas_actuales.append(linea)
+            largo_actual += len(linea) + 1
         else:
-            fragmento_actual = f"{fragmento_actual}\n{linea}" if fragmento_actual else linea
+            lineas_actuales, largo_actual = [linea], len(linea)
     
     # Agregar el último fragmento si existe
-    if fragmento_actual:
-        fragmentos.append(fragmento_actual)
+    if largo_actual:
+        fragmentos.append("\n".join(lineas_actuales))
     
     # Agregar numeración si hay múltiples fragmentos
     if len(fragmentos) > 1:
-        for i in range(len(fragmentos)):
-            fragmentos[i] = f"[Parte {i+1}/{len(fragmentos)}]\n\n" + fragmentos[i]
+        total = len(fragmentos)
+        fragmentos = [f"[Parte {i}/{total}]\n\n{fragmento}" for i, fragmento in enumerate(fragmentos, 1)]
     
     return fragmentos
 
+def _segundos_retry_after(error: RetryAfter) -> float:
+    """
+    Devuelve la espera pedida por Telegram en segundos (int o timedelta según la versión).
+    """
+    espera = error.retry_after
+    return espera.total_seconds() if isinstance(espera, timedelta) else float(espera)
+
 async def enviar_mensaje_telegram(
     mensaje: str,
     parse_mode: str = "HTML",
@@ -86,7 +115,7 @@ async def enviar_mensaje_telegram(
     
     # Dividir mensajes largos si es necesario
     fragmentos = _dividir_mensaje_largo(mensaje)
-    bot = Bot(token=BOT_TOKEN)  # Crear el bot una sola vez
+    bot = _obtener_bot()
 
     # Enviar cada fragmento
     for i, fragmento in enumerate(fragmentos):
@@ -100,6 +129,15 @@ async def enviar_mensaje_telegram(
                 )
                 logger.info(f"Mensaje {i+1}/{len(fragmentos)} enviado a Telegram correctamente")
                 break  # Éxito, salir del bucle de reintento
+            except RetryAfter as e:
+                # Límite de envíos del chat: esperar exactamente lo que indica Telegram
+                wait_time = _segundos_retry_after(e)
+                if attempt < retry_attempts:
+                    logger.warning(f"Límite de envíos de Telegram al enviar fragmento {i+1}. Reintento {attempt+1}/{retry_attempts} en {wait_time:.0f}s...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Límite de envíos persistente al enviar fragmento {i+1}: {e}")
+                    return False
             except (TimedOut, NetworkError) as e:
                 wait_time = 2 ** (attempt + 1)
                 if attempt < retry_attempts:
@@ -131,7 +169,7 @@ async def verificar_configuracion_telegram() -> Dict[str, Any]:
         return {"success": False, "error": "ID del chat no configurado"}
     
     try:
-        bot = Bot(token=BOT_TOKEN)
+        bot = _obtener_bot()
         bot_info = await bot.get_me()
         
         try:
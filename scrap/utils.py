@@ -2,6 +2,7 @@
 Funciones de utilidad para el scraping de precios de juegos de Xbox.
 """
 import re
+from functools import lru_cache
 from typing import Optional, Union, Literal
 
 # Compilar expresiones regulares para mejorar el rendimiento
@@ -11,17 +12,27 @@ _DISCOUNT_PERCENT_PATTERN = re.compile(r"(\d+)\s*%")  # Extrae el número antes
 def clean_price_to_float(price_str: Optional[str]) -> Optional[float]:
     """
     Convierte una cadena de precio (ej: 'ARS$ 1.234,56') a float.
+    Los precios se repiten mucho entre juegos, por eso la conversión se cachea.
     Args:
         price_str: Cadena con el precio a convertir.
     Returns:
         Valor float del precio o None si no es posible convertir.
     """
+    # La validación queda fuera de la caché: lru_cache falla con argumentos no hashables
     if not isinstance(price_str, str) or not price_str:
         return None
+    return _clean_price_to_float(price_str)
+
+@lru_cache(maxsize=4096)
+def _clean_price_to_float(price_str: str) -> Optional[float]:
+    """
+    Conversión cacheada de clean_price_to_float; recibe una cadena ya validada.
+    """
     try:
-        # Eliminar caracteres no numéricos relevantes
-        num_str = _PRICE_CLEAN_PATTERN.sub('', price_str.strip())
+        # Eliminar caracteres no numéricos relevantes (incluye los espacios)
+        num_str = _PRICE_CLEAN_PATTERN.sub('', price_str)
         # Unificar formato: quitar separador de miles y usar punto decimal
+        # (dos replace son más rápidos que str.translate en cadenas tan cortas)
         num_str = num_str.replace('.', '').replace(',', '.')
         return float(num_str) if num_str else None
     except (ValueError, TypeError):
@@ -30,6 +41,7 @@ def clean_price_to_float(price_str: Optional[str]) -> Optional[float]:
 def extract_discount_percentage(discount_text: Optional[str]) -> Optional[float]:
     """
     Extrae el porcentaje de descuento numérico de un texto como '-20%'.
+    Hay pocos textos de descuento distintos, así que el resultado también se cachea.
     Args:
         discount_text: Cadena con el porcentaje de descuento.
     Returns:
@@ -37,6 +49,13 @@ def extract_discount_percentage(discount_text: Optional[str]) -> Optional[float]
     """
     if not isinstance(discount_text, str) or not discount_text:
         return None
+    return _extract_discount_percentage(discount_text)
+
+@lru_cache(maxsize=1024)
+def _extract_discount_percentage(discount_text: str) -> Optional[float]:
+    """
+    Extracción cacheada de extract_discount_percentage; recibe una cadena ya validada.
+    """
     match = _DISCOUNT_PERCENT_PATTERN.search(discount_text)
     if match:
         try:
@@ -59,6 +78,9 @@ def comparar_precio(
     """
     if precio_actual is None or precio_previo is None:
         return None
+    # Caso más común: el precio no cambió
+    if precio_actual == precio_previo:
+        return "unchanged"
     # Tolerancia para evitar errores por precisión de float
     epsilon = 1e-3
     diff = precio_actual - precio_previo
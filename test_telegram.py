@@ -1,58 +1,72 @@
 #!/usr/bin/env python3
 import sys
-import json
 import asyncio
-import argparse
 import os
+import re
+import random
 from telegram import Bot
-from telegram.error import TelegramError
-import datetime
+from telegram.error import TelegramError, RetryAfter, TimedOut, NetworkError
+import time
+from datetime import timedelta
 
-# Configuración de Telegram (prioriza variables de entorno por sobre configuración local)
-BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
-CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
-DEBUG = os.environ.get('TELEGRAM_DEBUG', 'False').lower() == 'true'
+# Formato de token del Bot API: <id numérico>:<secreto de 35 caracteres>
+TOKEN_PATTERN = re.compile(r"^\d+:[A-Za-z0-9_-]{35,}$")
 
-# Si no hay variables de entorno, intenta importar del archivo de configuración local
-if not BOT_TOKEN or not CHAT_ID:
-    try:
-        from telegram_config import BOT_TOKEN as CONFIG_BOT_TOKEN
-        from telegram_config import CHAT_ID as CONFIG_CHAT_ID
-        from telegram_config import DEBUG as CONFIG_DEBUG
-        
-        # Solo usa la configuración del archivo si no se establecieron variables de entorno
-        if not BOT_TOKEN:
-            BOT_TOKEN = CONFIG_BOT_TOKEN
-        if not CHAT_ID:
-            CHAT_ID = CONFIG_CHAT_ID
-        if os.environ.get('TELEGRAM_DEBUG') is None:
-            DEBUG = CONFIG_DEBUG
+def cargar_configuracion():
+    """
+    Carga la configuración de Telegram (prioriza variables de entorno por sobre configuración local).
+    Devuelve (BOT_TOKEN, CHAT_ID, DEBUG), o termina el script si falta configuración.
+    """
+    bot_token = os.environ.get('TELEGRAM_BOT_TOKEN')
+    chat_id = os.environ.get('TELEGRAM_CHAT_ID')
+    debug = os.environ.get('TELEGRAM_DEBUG', 'False').lower() == 'true'
+
+    # Si no hay variables de entorno, intenta importar del archivo de configuración local
+    if not bot_token or not chat_id:
+        try:
+            from telegram_config import BOT_TOKEN as CONFIG_BOT_TOKEN
+            from telegram_config import CHAT_ID as CONFIG_CHAT_ID
+            from telegram_config import DEBUG as CONFIG_DEBUG
             
-        print("Usando configuración de Telegram desde archivo local")
-    except ImportError:
-        print("Error: No se encontró archivo telegram_config.py ni variables de entorno.")
-        print("Por favor, crea el archivo telegram_config.py con las siguientes variables:")
-        print("BOT_TOKEN = 'tu_token_del_bot'")
-        print("CHAT_ID = 'tu_chat_id'")
-        print("DEBUG = False")
-        print("\nAlternativamente, configura variables de entorno:")
-        print("export TELEGRAM_BOT_TOKEN='tu_token_del_bot'")
-        print("export TELEGRAM_CHAT_ID='tu_chat_id'")
+            # Solo usa la configuración del archivo si no se establecieron variables de entorno
+            if not bot_token:
+                bot_token = CONFIG_BOT_TOKEN
+            if not chat_id:
+                chat_id = CONFIG_CHAT_ID
+            if os.environ.get('TELEGRAM_DEBUG') is None:
+                debug = CONFIG_DEBUG
+                
+            print("Usando configuración de Telegram desde archivo local")
+        except ImportError:
+            print("Error: No se encontró archivo telegram_config.py ni variables de entorno.")
+            print("Por favor, crea el archivo telegram_config.py con las siguientes variables:")
+            print("BOT_TOKEN = 'tu_token_del_bot'")
+            print("CHAT_ID = 'tu_chat_id'")
+            print("DEBUG = False")
+            print("\nAlternativamente, configura variables de entorno:")
+            print("export TELEGRAM_BOT_TOKEN='tu_token_del_bot'")
+            print("export TELEGRAM_CHAT_ID='tu_chat_id'")
+            sys.exit(1)
+
+    if not bot_token or not chat_id:
+        print("Error: BOT_TOKEN o CHAT_ID no configurados correctamente")
         sys.exit(1)
 
-if not BOT_TOKEN or not CHAT_ID:
-    print("Error: BOT_TOKEN o CHAT_ID no configurados correctamente")
-    sys.exit(1)
+    # Validación local: evita una llamada a la API que fallaría por un token mal copiado
+    if not TOKEN_PATTERN.match(bot_token):
+        print("Error: BOT_TOKEN no tiene el formato esperado (<id>:<token>)")
+        sys.exit(1)
+    return bot_token, chat_id, debug
 
-async def test_telegram_notification():
-    """Prueba el envío de notificaciones a Telegram."""
-    try:
-        bot = Bot(token=BOT_TOKEN)
-        
-        # Mensaje de prueba
-        mensaje = f"""<b>🎮 PRUEBA DE NOTIFICACIÓN XBOX PRICES</b>
+# Se completan al ejecutar el script (ver __main__); importar el módulo no tiene efectos secundarios
+BOT_TOKEN = None
+CHAT_ID = None
+DEBUG = False
+
+# Mensaje de prueba: solo cambia la fecha entre envíos
+MENSAJE_PRUEBA = """<b>🎮 PRUEBA DE NOTIFICACIÓN XBOX PRICES</b>
 
-<i>Fecha: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</i>
+<i>Fecha: {fecha}</i>
 
 Este es un mensaje de prueba para verificar la configuración de Telegram.
 Si estás viendo este mensaje, la configuración es correcta. 👍
@@ -62,12 +76,60 @@ Si estás viendo este mensaje, la configuración es correcta. 👍
 2. Las notificaciones se enviarán cuando se detecten juegos con bajadas de precio.
 
 🌐 <a href="https://fdbustamante.github.io/xbox-prices/">Ver todos los juegos</a>"""
+
+# Bot compartido: su cliente HTTP (y la conexión TLS) se reutiliza en todos los envíos
+_bot = None
+
+def obtener_bot():
+    """Devuelve el Bot compartido, creándolo la primera vez."""
+    global _bot
+    if _bot is None:
+        _bot = Bot(token=BOT_TOKEN)
+    return _bot
+
+async def cerrar_bot():
+    """Cierra el cliente HTTP del Bot compartido, si se llegó a crear."""
+    global _bot
+    if _bot is not None:
+        await _bot.shutdown()
+        _bot = None
+
+async def enviar_con_reintentos(bot, max_reintentos=3, **kwargs):
+    """
+    Envía un mensaje reintentando ante el límite de envíos (RetryAfter) o errores de red.
+    Espera lo que indica Telegram, o un backoff exponencial, más un jitter aleatorio.
+    """
+    for intento in range(max_reintentos + 1):
+        try:
+            return await bot.send_message(**kwargs)
+        except RetryAfter as e:
+            if intento == max_reintentos:
+                raise
+            espera = e.retry_after
+            espera = espera.total_seconds() if isinstance(espera, timedelta) else float(espera)
+        except (TimedOut, NetworkError):
+            if intento == max_reintentos:
+                raise
+            espera = 2 ** (intento + 1)
+        espera += random.uniform(0, 0.3)
+        print(f"Reintento {intento + 1}/{max_reintentos} en {espera:.1f}s...")
+        await asyncio.sleep(espera)
+
+async def test_telegram_notification():
+    """Prueba el envío de notificaciones a Telegram."""
+    try:
+        bot = obtener_bot()
+        
+        # Mensaje de prueba
+        mensaje = MENSAJE_PRUEBA.format(fecha=time.strftime("%Y-%m-%d %H:%M:%S"))
         
         print("Enviando mensaje de prueba a Telegram...")
-        await bot.send_message(
+        await enviar_con_reintentos(
+            bot,
             chat_id=CHAT_ID, 
             text=mensaje,
-            parse_mode="HTML"
+            parse_mode="HTML",
+            disable_web_page_preview=True
         )
         print("¡Mensaje enviado con éxito! Verifica tu cuenta de Telegram.")
         return True
@@ -79,8 +141,15 @@ Si estás viendo este mensaje, la configuración es correcta. 👍
         return False
 
 if __name__ == "__main__":
+    BOT_TOKEN, CHAT_ID, DEBUG = cargar_configuracion()
     print(f"Probando notificación de Telegram con:")
     print(f"- BOT_TOKEN: {BOT_TOKEN[:4]}...{BOT_TOKEN[-4:]} (oculto por seguridad)")
     print(f"- CHAT_ID: {CHAT_ID}")
     
-    asyncio.run(test_telegram_notification())
+    async def _main():
+        try:
+            return await test_telegram_notification()
+        finally:
+            await cerrar_bot()
+
+    asyncio.run(_main())